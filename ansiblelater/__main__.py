@@ -12,6 +12,8 @@ from ansiblelater.candidate import Candidate
 from ansiblelater.settings import Settings
 from ansiblelater.standard import SingleStandards
 
+_settings = None
+
 
 def main():
     """Run main program."""
@@ -72,24 +74,8 @@ def main():
     SingleStandards(config["rules"]["standards"]).rules
 
     workers = max(multiprocessing.cpu_count() - 2, 2)
-    p = multiprocessing.Pool(workers)
-    tasks = []
-    for filename in config["rules"]["files"]:
-        candidate = Candidate.classify(filename, settings)
-        if candidate:
-            if candidate.binary:
-                LOG.info("Not reviewing binary file {name}".format(name=filename))
-                continue
-            if candidate.vault:
-                LOG.info("Not reviewing vault file {name}".format(name=filename))
-                continue
-            else:
-                LOG.info("Reviewing all of {candidate}".format(candidate=candidate))
-                tasks.append(candidate)
-        else:
-            LOG.info("Couldn't classify file {name}".format(name=filename))
-
-    errors = (sum(p.map(_review_wrapper, tasks)))
+    p = multiprocessing.Pool(workers, initializer=_init_worker, initargs=(settings,))
+    errors = (sum(p.map(_review_wrapper, config["rules"]["files"])))
     p.close()
     p.join()
 
@@ -101,7 +87,24 @@ def main():
     sys.exit(return_code)
 
 
-def _review_wrapper(candidate):
+def _init_worker(settings):
+    global _settings
+    _settings = settings
+
+
+def _review_wrapper(filename):
+    candidate = Candidate.classify(filename, _settings)
+    if not candidate:
+        LOG.info("Couldn't classify file %s", filename)
+        return 0
+    if candidate.binary:
+        LOG.info("Not reviewing binary file %s", filename)
+        return 0
+    if candidate.vault:
+        LOG.info("Not reviewing vault file %s", filename)
+        return 0
+
+    LOG.info("Reviewing all of %s", candidate)
     return candidate.review()
 
 
@@ -1,10 +1,8 @@
 """Review candidates."""
 
 import codecs
-import copy
 import os
 import re
-from distutils.version import LooseVersion
 
 from ansible.plugins.loader import module_loader
 
@@ -14,6 +12,60 @@ from ansiblelater.logger import flag_extra
 from ansiblelater.standard import SingleStandards
 from ansiblelater.standard import StandardBase
 
+_VERSION_RE = re.compile(r"^# Standards:\s*([\d.]+)", re.MULTILINE)
+
+# Role files of the same role share one meta/main.yml, cache lookups per process
+_role_dirs_cache = {}
+_meta_version_cache = {}
+_dir_entries_cache = {}
+
+
+def _dir_entries(path):
+    if path not in _dir_entries_cache:
+        dirs = set()
+        files = set()
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        dirs.add(entry.name)
+                    elif entry.is_file():
+                        files.add(entry.name)
+        except OSError:
+            pass
+
+        _dir_entries_cache[path] = (frozenset(dirs), frozenset(files))
+
+    return _dir_entries_cache[path]
+
+
+def _find_role_dirs(parentdir):
+    if parentdir not in _role_dirs_cache:
+        role_modules = None
+        meta_file = None
+        walkdir = parentdir
+        updir = os.path.dirname(walkdir)
+        while walkdir != updir and not (role_modules and meta_file):
+            subdirs, _ = _dir_entries(walkdir)
+            if not role_modules and "library" in subdirs:
+                role_modules = os.path.join(walkdir, "library")
+            if not meta_file and "meta" in subdirs:
+                meta_dir = os.path.join(walkdir, "meta")
+                if "main.yml" in _dir_entries(meta_dir)[1]:
+                    meta_file = os.path.join(meta_dir, "main.yml")
+            walkdir, updir = updir, os.path.dirname(updir)
+
+        _role_dirs_cache[parentdir] = (role_modules, meta_file)
+
+    return _role_dirs_cache[parentdir]
+
+
+def _read_version(path):
+    with codecs.open(path, mode="rb", encoding="utf-8") as f:
+        match = _VERSION_RE.search(f.read(4096))
+
+    return match.group(1) if match else None
+
 
 class Candidate(object):
     """
@@ -23,7 +75,7 @@ class Candidate(object):
     bundled with necessary meta informations for rule processing.
     """
 
-    def __init__(self, filename, settings={}, standards=[]):
+    def __init__(self, filename, settings={}, standards=None):
         self.path = filename
         self.binary = False
         self.vault = False
@@ -32,16 +84,28 @@ class Candidate(object):
         self.faulty = False
         self.config = settings.config
         self.settings = settings
+        if standards is None:
+            standards = SingleStandards(self.config["rules"]["standards"]).rules_by_type(
+                self.config["rules"]["filter"], self.config["rules"]["exclude_filter"]
+            )
+        self.standards = standards.get(self.filetype, [])
 
+        fd = os.open(filename, os.O_RDONLY)
         try:
-            with codecs.open(filename, mode="rb", encoding="utf-8") as f:
-                if f.readline().startswith("$ANSIBLE_VAULT"):
-                    self.vault = True
-        except UnicodeDecodeError:
-            self.binary = True
+            head = os.read(fd, 512)
+        finally:
+            os.close(fd)
+
+        self.vault = head.startswith(b"$ANSIBLE_VAULT")
+        self.binary = b"\x00" in head
+        if not self.binary:
+            try:
+                head.decode("utf-8")
+            except UnicodeDecodeError as e:
+                # a multibyte char cut off at the buffer end is not a binary marker
+                self.binary = e.reason != "unexpected end of data"
 
     def _get_version(self):
-        path = self.path
         version = None
         config_version = self.config["rules"]["version"].strip()
 
@@ -52,79 +116,54 @@ class Candidate(object):
                 version = match.group(1)
 
         if not self.binary:
-            if isinstance(self, RoleFile):
-                parentdir = os.path.dirname(os.path.abspath(self.path))
-                while parentdir != os.path.dirname(parentdir):
-                    meta_file = os.path.join(parentdir, "meta", "main.yml")
-                    if os.path.exists(meta_file):
-                        path = meta_file
-                        break
-                    parentdir = os.path.dirname(parentdir)
-
-            version_file_re = re.compile(r"^# Standards:\s*([\d.]+)")
-            with codecs.open(path, mode="rb", encoding="utf-8") as f:
-                for line in f:
-                    match = version_file_re.match(line)
-                    if match:
-                        version = match.group(1)
+            meta_file = self.meta_file if isinstance(self, RoleFile) else None
+            if meta_file:
+                if meta_file not in _meta_version_cache:
+                    _meta_version_cache[meta_file] = _read_version(meta_file)
+                file_version = _meta_version_cache[meta_file]
+            else:
+                file_version = _read_version(self.path)
+
+            if file_version:
+                version = file_version
 
         if not version:
-            version = utils.standards_latest(self.standards)
+            version = utils.standards_latest(
+                SingleStandards(self.config["rules"]["standards"]).rules
+            )
             if self.expected_version:
                 if isinstance(self, RoleFile):
                     LOG.warning(
-                        "{name} {path} is in a role that contains a meta/main.yml without a "
+                        "%s %s is in a role that contains a meta/main.yml without a "
                         "declared standards version. "
-                        "Using latest standards version {version}".format(
-                            name=type(self).__name__, path=self.path, version=version
-                        )
+                        "Using latest standards version %s",
+                        type(self).__name__, self.path, version
                     )
                 else:
                     LOG.warning(
-                        "{name} {path} does not present standards version. "
-                        "Using latest standards version {version}".format(
-                            name=type(self).__name__, path=self.path, version=version
-                        )
+                        "%s %s does not present standards version. "
+                        "Using latest standards version %s",
+                        type(self).__name__, self.path, version
                     )
         else:
             LOG.info(
-                "{name} {path} declares standards version {version}".format(
-                    name=type(self).__name__, path=self.path, version=version
-                )
+                "%s %s declares standards version %s",
+                type(self).__name__, self.path, version
             )
 
         return version
 
-    def _filter_standards(self):
-        target_standards = []
-        includes = self.config["rules"]["filter"]
-        excludes = self.config["rules"]["exclude_filter"]
-
-        if len(includes) == 0:
-            includes = [s.sid for s in self.standards]
-
-        for standard in self.standards:
-            if standard.sid in includes and standard.sid not in excludes:
-                target_standards.append(standard)
-
-        return target_standards
-
     def review(self, lines=None):
         errors = 0
-        self.standards = SingleStandards(self.config["rules"]["standards"]).rules
         self.version = self._get_version()
+        version = utils.parse_version(self.version)
 
-        for standard in self._filter_standards():
-            if type(self).__name__.lower() not in standard.types:
-                continue
-
+        for standard in self.standards:
             result = standard.check(self, self.config)
 
             if not result:
                 LOG.error(
-                    "Standard '{id}' returns an empty result object. Check failed!".format(
-                        id=standard.sid
-                    )
+                    "Standard '%s' returns an empty result object. Check failed!", standard.sid
                 )
                 continue
 
@@ -138,40 +177,39 @@ class Candidate(object):
             if standard.sid and standard.sid.strip():
                 labels["sid"] = standard.sid
 
+            sid = self._format_id(standard.sid)
+            std_version = utils.parse_version(standard.version) if standard.version else None
+
             for err in result.errors:
-                err_labels = copy.copy(labels)
-                err_labels["passed"] = False
+                err_labels = {**labels, "passed": False}
                 if isinstance(err, StandardBase.Error):
                     err_labels.update(err.to_dict())
 
-                if not standard.version:
+                if not std_version:
                     LOG.warning(
-                        "{sid}Best practice '{description}' not met:\n{path}:{error}".format(
-                            sid=self._format_id(standard.sid),
-                            description=standard.description,
-                            path=self.path,
-                            error=err
-                        ),
+                        "%sBest practice '%s' not met:\n%s:%s",
+                        sid,
+                        standard.description,
+                        self.path,
+                        err,
                         extra=flag_extra(err_labels)
                     )
-                elif LooseVersion(standard.version) > LooseVersion(self.version):
+                elif std_version > version:
                     LOG.warning(
-                        "{sid}Future standard '{description}' not met:\n{path}:{error}".format(
-                            sid=self._format_id(standard.sid),
-                            description=standard.description,
-                            path=self.path,
-                            error=err
-                        ),
+                        "%sFuture standard '%s' not met:\n%s:%s",
+                        sid,
+                        standard.description,
+                        self.path,
+                        err,
                         extra=flag_extra(err_labels)
                     )
                 else:
                     LOG.error(
-                        "{sid}Standard '{description}' not met:\n{path}:{error}".format(
-                            sid=self._format_id(standard.sid),
-                            description=standard.description,
-                            path=self.path,
-                            error=err
-                        ),
+                        "%sStandard '%s' not met:\n%s:%s",
+                        sid,
+                        standard.description,
+                        self.path,
+                        err,
                         extra=flag_extra(err_labels)
                     )
                     errors = errors + 1
@@ -179,26 +217,20 @@ class Candidate(object):
         return errors
 
     @staticmethod
-    def classify(filename, settings={}, standards=[]):
+    def classify(filename, settings={}, standards=None):
         parentdir = os.path.basename(os.path.dirname(filename))
         basename = os.path.basename(filename)
+        parts = frozenset(filename.split(os.sep))
 
-        if parentdir in ["tasks"]:
-            return Task(filename, settings, standards)
-        if parentdir in ["handlers"]:
-            return Handler(filename, settings, standards)
-        if parentdir in ["vars", "defaults"]:
-            return RoleVars(filename, settings, standards)
-        if "group_vars" in filename.split(os.sep):
+        if parentdir in _ROLE_PARENTDIRS:
+            return _ROLE_PARENTDIRS[parentdir](filename, settings, standards)
+        if "group_vars" in parts:
             return GroupVars(filename, settings, standards)
-        if "host_vars" in filename.split(os.sep):
+        if "host_vars" in parts:
             return HostVars(filename, settings, standards)
-        if parentdir in ["meta"]:
-            return Meta(filename, settings, standards)
-        if (
-            parentdir in ["library", "lookup_plugins", "callback_plugins", "filter_plugins"]
-            or filename.endswith(".py")
-        ):
+        if parentdir in _META_CODE_PARENTDIRS:
+            return _META_CODE_PARENTDIRS[parentdir](filename, settings, standards)
+        if filename.endswith(".py"):
             return Code(filename, settings, standards)
         if basename == "inventory" or basename == "hosts" or parentdir in ["inventories"]:
             return Inventory(filename, settings, standards)
@@ -206,11 +238,11 @@ class Candidate(object):
             return Rolesfile(filename, settings, standards)
         if "Makefile" in basename:
             return Makefile(filename, settings, standards)
-        if "templates" in filename.split(os.sep) or basename.endswith(".j2"):
+        if "templates" in parts or basename.endswith(".j2"):
             return Template(filename, settings, standards)
-        if "files" in filename.split(os.sep):
+        if "files" in parts:
             return File(filename, settings, standards)
-        if basename.endswith(".yml") or basename.endswith(".yaml"):
+        if basename.endswith((".yml", ".yaml")):
             return Playbook(filename, settings, standards)
         if "README" in basename:
             return Doc(filename, settings, standards)
@@ -232,16 +264,12 @@ class Candidate(object):
 class RoleFile(Candidate):
     """Object classified as Ansible role file."""
 
-    def __init__(self, filename, settings={}, standards=[]):
+    def __init__(self, filename, settings={}, standards=None):
         super(RoleFile, self).__init__(filename, settings, standards)
 
-        parentdir = os.path.dirname(os.path.abspath(filename))
-        while parentdir != os.path.dirname(parentdir):
-            role_modules = os.path.join(parentdir, "library")
-            if os.path.exists(role_modules):
-                module_loader.add_directory(role_modules)
-                break
-            parentdir = os.path.dirname(parentdir)
+        role_modules, self.meta_file = _find_role_dirs(os.path.dirname(os.path.abspath(filename)))
+        if role_modules:
+            module_loader.add_directory(role_modules)
 
 
 class Playbook(Candidate):
@@ -253,7 +281,7 @@ class Playbook(Candidate):
 class Task(RoleFile):
     """Object classified as Ansible task file."""
 
-    def __init__(self, filename, settings={}, standards=[]):
+    def __init__(self, filename, settings={}, standards=None):
         super(Task, self).__init__(filename, settings, standards)
         self.filetype = "tasks"
 
@@ -261,7 +289,7 @@ class Task(RoleFile):
 class Handler(RoleFile):
     """Object classified as Ansible handler file."""
 
-    def __init__(self, filename, settings={}, standards=[]):
+    def __init__(self, filename, settings={}, standards=None):
         super(Handler, self).__init__(filename, settings, standards)
         self.filetype = "handlers"
 
@@ -275,7 +303,7 @@ class Vars(Candidate):
 class Unversioned(Candidate):
     """Object classified as unversioned file."""
 
-    def __init__(self, filename, settings={}, standards=[]):
+    def __init__(self, filename, settings={}, standards=None):
         super(Unversioned, self).__init__(filename, settings, standards)
         self.expected_version = False
 
@@ -350,3 +378,21 @@ class Rolesfile(Unversioned):
     """Object classified as Ansible roles file."""
 
     pass
+
+
+# Parent directory lookup tables for `Candidate.classify`. Role directories take
+# precedence over group_vars/host_vars paths, meta and plugin directories do not.
+_ROLE_PARENTDIRS = {
+    "tasks": Task,
+    "handlers": Handler,
+    "vars": RoleVars,
+    "defaults": RoleVars,
+}
+
+_META_CODE_PARENTDIRS = {
+    "meta": Meta,
+    "library": Code,
+    "lookup_plugins": Code,
+    "callback_plugins": Code,
+    "filter_plugins": Code,
+}
@@ -61,8 +61,9 @@ class MultilineFormatter(logging.Formatter):
     """Logging Formatter to reset color after newline characters."""
 
     def format(self, record):  # noqa
-        record.msg = record.msg.replace("\n", "\n{}... ".format(colorama.Style.RESET_ALL))
+        record.msg = record.getMessage().replace("\n", "\n{}... ".format(colorama.Style.RESET_ALL))
         record.msg = record.msg + "\n"
+        record.args = ()
         return logging.Formatter.format(self, record)
 
 
@@ -70,7 +71,8 @@ class MultilineJsonFormatter(jsonlogger.JsonFormatter):
     """Logging Formatter to remove newline characters."""
 
     def format(self, record):  # noqa
-        record.msg = record.msg.replace("\n", " ")
+        record.msg = record.getMessage().replace("\n", " ")
+        record.args = ()
         return jsonlogger.JsonFormatter.format(self, record)
 
 
@@ -36,7 +36,7 @@ class StandardMeta(type):
         setattr(mcls, "description", getattr(cls, "description", "__unknown__"))
         setattr(mcls, "helptext", getattr(cls, "helptext", ""))
         setattr(mcls, "version", getattr(cls, "version", None))
-        setattr(mcls, "types", getattr(cls, "types", []))
+        setattr(mcls, "types", frozenset(getattr(cls, "types", [])))
         return mcls
 
 
@@ -57,7 +57,7 @@ class StandardBase(object, metaclass=StandardExtendedMeta):
 
     def __repr__(self):  # noqa
         return "Standard: {description} (version: {version}, types: {types})".format(
-            description=self.description, version=self.version, types=self.types
+            description=self.description, version=self.version, types=sorted(self.types)
         )
 
     @staticmethod
@@ -313,6 +313,7 @@ class StandardLoader():
 
     def __init__(self, source):
         self.rules = []
+        self._rules_by_type = {}
 
         for s in source:
             for p in pathlib.Path(s).glob("*.py"):
@@ -341,6 +342,29 @@ class StandardLoader():
 
         self.validate()
 
+    def rules_by_type(self, includes=[], excludes=[]):
+        """
+        Filter rules by ID and group them by the file types they apply to.
+
+        :param includes: Rule ID's to limit the rules to, all rules if empty.
+        :param excludes: Rule ID's to exclude.
+        :returns: dict of file type to list of rules
+
+        """
+        includes = frozenset(includes)
+        excludes = frozenset(excludes)
+
+        if (includes, excludes) not in self._rules_by_type:
+            grouped = defaultdict(list)
+            for standard in self.rules:
+                if (not includes or standard.sid in includes) and standard.sid not in excludes:
+                    for filetype in standard.types:
+                        grouped[filetype].append(standard)
+
+            self._rules_by_type[(includes, excludes)] = dict(grouped)
+
+        return self._rules_by_type[(includes, excludes)]
+
     def _is_plugin(self, obj):
         return inspect.isclass(obj) and issubclass(
             obj, StandardBase
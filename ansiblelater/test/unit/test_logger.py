@@ -2,6 +2,8 @@
 
 from __future__ import print_function
 
+import json
+
 import colorama
 
 from ansiblelater import logger
@@ -64,6 +66,30 @@ def test_warn(capsys, mocker):
     assert x == stdout
 
 
+def test_warn_multiline(capsys, mocker):
+    log = logger.get_logger("test_warn_multiline")
+    log.warning("%s", "foo\nbar")
+    stdout, _ = capsys.readouterr()
+
+    print(
+        "{}{}WARNING:{} foo\n{}... bar\n{}".format(
+            colorama.Fore.YELLOW, colorama.Style.BRIGHT, colorama.Style.NORMAL,
+            colorama.Style.RESET_ALL, colorama.Style.RESET_ALL
+        )
+    )
+    x, _ = capsys.readouterr()
+
+    assert x == stdout
+
+
+def test_warn_multiline_json(capsys, mocker):
+    log = logger.get_logger("test_warn_multiline_json", json=True)
+    log.warning("%s", "foo\nbar")
+    stdout, _ = capsys.readouterr()
+
+    assert json.loads(stdout)["message"] == "foo bar"
+
+
 def test_info(capsys, mocker):
     log = logger.get_logger("test_info")
     log.info("foo")
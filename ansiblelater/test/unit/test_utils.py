@@ -0,0 +1,31 @@
+"""Test utils module."""
+
+from types import SimpleNamespace
+
+from ansiblelater import utils
+
+
+def test_parse_version_numeric():
+    assert utils.parse_version("1.10") > utils.parse_version("1.9")
+
+
+def test_parse_version_length():
+    assert utils.parse_version("0.1") < utils.parse_version("0.1.0")
+
+
+def test_parse_version_prerelease():
+    # same order as distutils LooseVersion
+    assert utils.parse_version("1.0b1") > utils.parse_version("1.0")
+    assert utils.parse_version("1.0b1") < utils.parse_version("1.0.1")
+
+
+def test_standards_latest():
+    standards = [SimpleNamespace(version="0.2"), SimpleNamespace(version="0.10")]
+
+    assert utils.standards_latest(standards) == "0.10"
+
+
+def test_standards_latest_unversioned():
+    standards = [SimpleNamespace(version=None)]
+
+    assert utils.standards_latest(standards) == "0.1"
@@ -3,10 +3,10 @@
 from __future__ import print_function
 
 import contextlib
+import functools
 import os
 import re
 import sys
-from distutils.version import LooseVersion
 
 import yaml
 
@@ -47,9 +47,16 @@ def get_property(prop):
     return result.group(1)
 
 
+@functools.lru_cache(maxsize=256)
+def parse_version(version):
+    # Like LooseVersion, but keeps mixed numeric/alpha components comparable
+    return tuple((int(c), "") if c.isdigit() else (-1, c)
+                 for c in re.findall(r"\d+|[a-zA-Z]+", str(version)))
+
+
 def standards_latest(standards):
     return max([standard.version for standard in standards if standard.version] or ["0.1"],
-               key=LooseVersion)
+               key=parse_version)
 
 
 def lines_ranges(lines_spec):